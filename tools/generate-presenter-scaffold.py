@@ -12,24 +12,39 @@ Setup:
 
 Usage:
     tools/.venv/bin/python3 tools/generate-presenter-scaffold.py <project> <feature-name>
+    tools/.venv/bin/python3 tools/generate-presenter-scaffold.py <project> --discover [--generate]
 
     Or use the wrapper:
     ./tools/scaffold-presenter <project> <feature-name>
+    ./tools/scaffold-presenter <project> --discover [--generate]
 
 Arguments:
     project: 'platform' or 'cms'
     feature-name: Any casing (e.g., 'SaveHomePage', 'save-home-page', 'save_home_page')
 
+Discovery mode:
+    --discover  Index the presenters and hooks under apps/<project>/src/lib/infrastructure
+                and the use cases of the project: those defined in packages/models
+                usecase-models or the installed cms-rest package that apps/<project>
+                refers to, and those it imports from cms-rest. Then list the use cases
+                that have no presenter yet.
+    --generate  Together with --discover, scaffold all missing presenters in one run.
+                Files that already exist are left untouched, and view models already
+                exported from packages/models view-models are reused.
+
 Example:
     ./tools/scaffold-presenter cms save-home-page
     ./tools/scaffold-presenter platform GetCourseDetails
+    ./tools/scaffold-presenter platform --discover --generate
 """
 
+import argparse
 import os
 import sys
 import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 # Try to use humps library for better case conversion, fallback to built-in
 try:
@@ -38,6 +53,8 @@ try:
 except ImportError:
     HAS_HUMPS = False
 
+CMS_REST_MODULE = '@dream-aim-deliver/e-class-cms-rest'
+
 
 def to_kebab_case(s: str) -> str:
     """Convert any case format to kebab-case using humps if available."""
@@ -71,8 +88,13 @@ def to_camel_case(s: str) -> str:
     return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
 
 
-def generate_view_model(feature_kebab: str, feature_pascal: str, output_dir: Path) -> None:
-    """Generate view model file with cms-rest import."""
+def generate_view_model(
+    feature_kebab: str,
+    feature_pascal: str,
+    output_dir: Path,
+    success_schema_module: str = CMS_REST_MODULE,
+) -> None:
+    """Generate view model file importing the success schema (cms-rest by default)."""
     content = f'''import {{ z }} from 'zod';
 import {{
     BaseDiscriminatedViewModeSchemaFactory,
@@ -81,7 +103,7 @@ import {{
     BaseErrorDataSchemaFactory,
     BaseViewModelDiscriminatedUnionSchemaFactory
 }} from '@dream-aim-deliver/dad-cats';
-import {{ {feature_pascal}SuccessResponseSchema }} from '@dream-aim-deliver/e-class-cms-rest';
+import {{ {feature_pascal}SuccessResponseSchema }} from '{success_schema_module}';
 
 // Extract success data from usecase response
 export const {feature_pascal}SuccessSchema = {feature_pascal}SuccessResponseSchema.shape.data;
@@ -121,15 +143,33 @@ export type T{feature_pascal}ViewModel = z.infer<typeof {feature_pascal}ViewMode
     print(f"✓ Generated: {file_path}")
 
 
-def generate_presenter(feature_kebab: str, feature_pascal: str, output_dir: Path) -> None:
-    """Generate presenter file with cms-rest imports."""
-    content = f'''import {{ viewModels }} from '@maany_shr/e-class-models';
-import {{
-    {feature_pascal}UseCaseResponseSchema,
-    T{feature_pascal}UseCaseResponse,
-    T{feature_pascal}ErrorResponse,
-}} from '@dream-aim-deliver/e-class-cms-rest';
-import {{
+def generate_presenter(
+    feature_kebab: str,
+    feature_pascal: str,
+    output_dir: Path,
+    use_case_models: bool = False,
+    error_type: Optional[str] = None,
+) -> None:
+    """
+    Generate presenter file with cms-rest imports, or with the `useCaseModels`
+    namespace of @maany_shr/e-class-models when use_case_models is set.
+    """
+    error_type = error_type or f"T{feature_pascal}ErrorResponse"
+    if use_case_models:
+        prefix = "useCaseModels."
+        imports = "import { viewModels, useCaseModels } from '@maany_shr/e-class-models';\n"
+    else:
+        prefix = ""
+        imports = (
+            "import { viewModels } from '@maany_shr/e-class-models';\n"
+            "import {\n"
+            f"    {feature_pascal}UseCaseResponseSchema,\n"
+            f"    T{feature_pascal}UseCaseResponse,\n"
+            f"    {error_type},\n"
+            f"}} from {CMS_REST_MODULE!r};\n"
+        )
+
+    content = f'''{imports}import {{
     BasePresenter,
     TBaseResponseResponseMiddleware,
     UnhandledErrorResponse
@@ -140,7 +180,7 @@ export type T{feature_pascal}PresenterUtilities = {{}};
 
 export const {feature_pascal}ResponseMiddleware =
     {{}} satisfies TBaseResponseResponseMiddleware<
-        T{feature_pascal}UseCaseResponse,
+        {prefix}T{feature_pascal}UseCaseResponse,
         viewModels.T{feature_pascal}ViewModel,
         T{feature_pascal}PresenterUtilities
     >;
@@ -148,7 +188,7 @@ export const {feature_pascal}ResponseMiddleware =
 type T{feature_pascal}ResponseMiddleware = typeof {feature_pascal}ResponseMiddleware;
 
 export default class {feature_pascal}Presenter extends BasePresenter<
-    T{feature_pascal}UseCaseResponse,
+    {prefix}T{feature_pascal}UseCaseResponse,
     viewModels.T{feature_pascal}ViewModel,
     T{feature_pascal}PresenterUtilities,
     T{feature_pascal}ResponseMiddleware
@@ -159,7 +199,7 @@ export default class {feature_pascal}Presenter extends BasePresenter<
     ) {{
         super({{
             schemas: {{
-                responseModel: {feature_pascal}UseCaseResponseSchema,
+                responseModel: {prefix}{feature_pascal}UseCaseResponseSchema,
                 viewModel: viewModels.{feature_pascal}ViewModelSchema
             }},
             middleware: {feature_pascal}ResponseMiddleware,
@@ -170,7 +210,7 @@ export default class {feature_pascal}Presenter extends BasePresenter<
 
     presentSuccess(
         response: Extract<
-            T{feature_pascal}UseCaseResponse,
+            {prefix}T{feature_pascal}UseCaseResponse,
             {{ success: true }}
         >,
     ): viewModels.T{feature_pascal}ViewModel {{
@@ -184,7 +224,7 @@ export default class {feature_pascal}Presenter extends BasePresenter<
 
     presentError(
         response: UnhandledErrorResponse<
-            T{feature_pascal}ErrorResponse,
+            {prefix}{error_type},
             T{feature_pascal}ResponseMiddleware
         >,
     ): viewModels.T{feature_pascal}ViewModel {{
@@ -263,26 +303,426 @@ def update_view_models_index(feature_kebab: str, index_path: Path) -> None:
     print(f"✓ Updated: {index_path}")
 
 
-def main():
-    if len(sys.argv) < 3:
-        print("Error: Missing required arguments")
-        print("\nUsage:")
-        print("  python3 tools/generate-presenter-scaffold.py <project> <feature-name>")
-        print("\nArguments:")
-        print("  project:      'platform' or 'cms'")
-        print("  feature-name: Any casing (e.g., 'SaveHomePage', 'save-home-page')")
-        print("\nExample:")
-        print("  python3 tools/generate-presenter-scaffold.py cms save-home-page")
-        sys.exit(1)
+USE_CASE_SCHEMA_PATTERN = re.compile(r'\b([A-Z][A-Za-z0-9]*)UseCaseResponseSchema\b')
+USE_CASE_DEFINITION_PATTERN = re.compile(r'\bconst\s+([A-Z][A-Za-z0-9]*)UseCaseResponseSchema\b')
+# Any usecase model identifier, e.g. 'TGetCourseShortUseCaseErrorResponse' -> 'GetCourseShort'
+USE_CASE_REFERENCE_PATTERN = re.compile(
+    r'\bT?([A-Z][A-Za-z0-9]*?)(?:UseCase)?(?:Request|SuccessResponse|ErrorResponse|Response)(?:Schema)?\b'
+)
+TRPC_PROCEDURE_PATTERN = re.compile(r'\btrpc\.([a-z][A-Za-z0-9]*)\b')
+RESPONSE_MODEL_PATTERN = re.compile(
+    r'\bresponseModel:\s*(?:useCaseModels\.)?([A-Z][A-Za-z0-9]*?)(?:UseCase)?ResponseSchema\b'
+)
+CMS_REST_IMPORT_PATTERN = re.compile(
+    r"import\s+(?:type\s+)?\{([^}]*)\}\s*from\s*['\"]" + re.escape(CMS_REST_MODULE) + r"['\"]"
+)
+VIEW_MODEL_EXPORT_PATTERN = re.compile(r'\bexport\s+(?:const|type)\s+([A-Za-z0-9_]+)\b')
+INDEX_EXPORT_PATTERN = re.compile(r"export \* from ['\"]\./([^'\"]+)['\"]")
+SOURCE_SUFFIXES = ('.ts', '.tsx')
+SKIPPED_DIRS = {'node_modules', 'dist', 'build', 'out-tsc', 'coverage', '.next', '.nx', '.git'}
+CMS_REST_PACKAGE = Path("node_modules/@dream-aim-deliver/e-class-cms-rest")
+USE_CASE_MODELS_DIR = Path("packages/models/src/usecase-models")
+
+SOURCE_CMS_REST = 'cms-rest'
+SOURCE_USE_CASE_MODELS = 'usecase-models'
+
+
+@dataclass(frozen=True)
+class UseCase:
+    """A use case and the package its response schema is imported from."""
+    name: str
+    source: str
+    models_file: Optional[Path] = None
+    error_type: Optional[str] = None
+    problem: Optional[str] = None
+
+    @property
+    def resolved(self) -> bool:
+        """Whether every name the generated files import from the source is exported."""
+        return self.problem is None
+
+
+@dataclass(frozen=True)
+class PresenterCoverage:
+    """Result of indexing one project's presenters against the known use cases."""
+    use_cases: Dict[str, UseCase]
+    presenters: Dict[Path, Optional[str]]
+    hooks: Set[str]
+    missing: List[UseCase]
+    presenters_without_hooks: List[Path]
+
+
+def iter_source_files(root: Path, skip_build_dirs: bool = True) -> Iterator[Path]:
+    """Yield TypeScript sources below root, skipping dependency and build output folders."""
+    if not root.exists():
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        if skip_build_dirs:
+            dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+        for filename in filenames:
+            if filename.endswith(SOURCE_SUFFIXES):
+                yield Path(dirpath) / filename
+
+
+def read_source(file_path: Path) -> str:
+    """Read a source file, returning an empty string if it cannot be decoded."""
+    try:
+        return file_path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return ''
+
+
+def presenter_feature(file_path: Path) -> str:
+    """Return the feature name of a presenter or hook file ('x-presenter.ts' -> 'x')."""
+    return file_path.name.rsplit('.', 1)[0][:-len('-presenter')]
+
+
+def index_reexports(index_path: Path) -> Set[str]:
+    """Return the module stems re-exported with `export * from './<stem>'` in an index.ts."""
+    return {
+        module.rsplit('.', 1)[0] if module.endswith(SOURCE_SUFFIXES) else module
+        for module in INDEX_EXPORT_PATTERN.findall(read_source(index_path))
+    }
+
+
+def resolve_use_case_models(name: str, file_path: Path, reexported: Set[str]) -> UseCase:
+    """Check that a usecase-models file exports everything the generated files import."""
+    content = read_source(file_path)
+    error_type = re.search(rf'\bexport type (T{name}(?:UseCase)?ErrorResponse)\b', content)
+    if file_path.stem not in reexported:
+        problem = "not re-exported from usecase-models/index.ts"
+    elif not re.search(rf'\bexport const {name}SuccessResponseSchema\b', content):
+        problem = f"does not export {name}SuccessResponseSchema"
+    elif not re.search(rf'\bexport type T{name}UseCaseResponse\b', content):
+        problem = f"does not export T{name}UseCaseResponse"
+    elif not error_type:
+        problem = f"does not export T{name}UseCaseErrorResponse"
+    else:
+        problem = None
+    return UseCase(
+        name=name,
+        source=SOURCE_USE_CASE_MODELS,
+        models_file=file_path,
+        error_type=error_type.group(1) if error_type else None,
+        problem=problem,
+    )
+
+
+def collect_project_references(project: str, repo_root: Path) -> Tuple[Set[str], Set[str], Set[str]]:
+    """
+    Scan apps/<project> for the use cases it refers to.
+
+    Returns:
+        The use case names found in usecase model identifiers (e.g. useCaseModels.TXUseCaseResponse),
+        the tRPC procedures it calls, and the response schemas it imports from cms-rest.
+    """
+    referenced: Set[str] = set()
+    procedures: Set[str] = set()
+    cms_rest_imports: Set[str] = set()
+    for file_path in iter_source_files(repo_root / f"apps/{project}"):
+        content = read_source(file_path)
+        referenced.update(USE_CASE_REFERENCE_PATTERN.findall(content))
+        procedures.update(TRPC_PROCEDURE_PATTERN.findall(content))
+        for imported in CMS_REST_IMPORT_PATTERN.findall(content):
+            cms_rest_imports.update(USE_CASE_SCHEMA_PATTERN.findall(imported))
+    return referenced, procedures, cms_rest_imports
+
+
+def collect_use_cases(project: str, repo_root: Path) -> Dict[str, UseCase]:
+    """
+    Collect the use cases of a project.
+
+    Use cases are defined in packages/models usecase-models and, when node_modules is
+    installed, in the cms-rest package. Both are shared by all apps, so a definition only
+    counts when apps/<project> refers to it, through one of its usecase model names or its
+    tRPC procedure. Response schemas the project imports from cms-rest always count.
+    """
+    referenced, procedures, cms_rest_imports = collect_project_references(project, repo_root)
+
+    def used_by_project(name: str) -> bool:
+        return name in referenced or name[0].lower() + name[1:] in procedures
+
+    use_cases: Dict[str, UseCase] = {}
+
+    models_dir = repo_root / USE_CASE_MODELS_DIR
+    reexported = index_reexports(models_dir / "index.ts")
+    for file_path in iter_source_files(models_dir):
+        for name in USE_CASE_DEFINITION_PATTERN.findall(read_source(file_path)):
+            if used_by_project(name):
+                use_cases[name] = resolve_use_case_models(name, file_path, reexported)
+
+    # cms-rest is what the default templates import from, so it takes precedence
+    cms_rest_names = set(cms_rest_imports)
+    for file_path in iter_source_files(repo_root / CMS_REST_PACKAGE, skip_build_dirs=False):
+        cms_rest_names.update(
+            name for name in USE_CASE_DEFINITION_PATTERN.findall(read_source(file_path))
+            if used_by_project(name)
+        )
+    for name in cms_rest_names:
+        use_cases[name] = UseCase(name=name, source=SOURCE_CMS_REST)
+
+    return use_cases
+
+
+def index_presenters(infrastructure_dir: Path) -> Tuple[Dict[Path, Optional[str]], Set[str]]:
+    """
+    Index presenters and presenter hooks below the infrastructure directory.
+
+    Returns:
+        A mapping of presenter file to the use case passed as its `responseModel`
+        (None for presenters that only wrap another presenter), and the set of
+        feature names (kebab-case) that already have a 'use-<feature>-presenter' hook.
+    """
+    presenters: Dict[Path, Optional[str]] = {}
+    hooks: Set[str] = set()
+    for file_path in iter_source_files(infrastructure_dir):
+        if not file_path.name.rsplit('.', 1)[0].endswith('-presenter'):
+            continue
+        if file_path.name.startswith('use-'):
+            hooks.add(presenter_feature(file_path)[len('use-'):])
+        else:
+            response_model = RESPONSE_MODEL_PATTERN.search(read_source(file_path))
+            presenters[file_path] = response_model.group(1) if response_model else None
+    return presenters, hooks
+
+
+def discover_presenter_coverage(project: str, repo_root: Path) -> PresenterCoverage:
+    """Find the use cases that have no presenter in the given project."""
+    infrastructure_dir = repo_root / f"apps/{project}/src/lib/infrastructure"
+    use_cases = collect_use_cases(project, repo_root)
+    presenters, hooks = index_presenters(infrastructure_dir)
+
+    # A presenter named after the use case covers it. Presenters are not always named that
+    # way (e.g. 'categories-presenter' presents ListCategories), so the schema passed as
+    # `responseModel` is the fallback; other schema references are ignored.
+    presenter_features = {presenter_feature(path) for path in presenters}
+    response_models = {name for name in presenters.values() if name}
+
+    missing = [
+        use_cases[name] for name in sorted(use_cases)
+        if to_kebab_case(name) not in presenter_features and name not in response_models
+    ]
+    presenters_without_hooks = sorted(
+        path for path in presenters
+        if "/common/presenters/" in path.as_posix() and presenter_feature(path) not in hooks
+    )
+    return PresenterCoverage(
+        use_cases=use_cases,
+        presenters=presenters,
+        hooks=hooks,
+        missing=missing,
+        presenters_without_hooks=presenters_without_hooks,
+    )
+
+
+def find_exported_names(file_path: Path) -> Set[str]:
+    """Return the names a module exports with `export const` or `export type`."""
+    return set(VIEW_MODEL_EXPORT_PATTERN.findall(read_source(file_path)))
+
+
+def view_model_template_exports(feature_pascal: str) -> Set[str]:
+    """Return the names exported by a view model created with generate_view_model."""
+    return {
+        f"{feature_pascal}SuccessSchema",
+        f"T{feature_pascal}Success",
+        f"{feature_pascal}ViewModelSchemaMap",
+        f"T{feature_pascal}ViewModelSchemaMap",
+        f"{feature_pascal}ViewModelSchema",
+        f"T{feature_pascal}ViewModel",
+    }
+
+
+def index_view_model_exports(index_path: Path) -> Dict[str, Path]:
+    """Map every name re-exported by the view models index.ts to the file exporting it."""
+    exports: Dict[str, Path] = {}
+    for stem in sorted(index_reexports(index_path)):
+        file_path = index_path.parent / f"{stem}.ts"
+        for name in find_exported_names(file_path):
+            exports.setdefault(name, file_path)
+    return exports
+
+
+def generate_missing_scaffolds(
+    missing: List[UseCase],
+    view_models_dir: Path,
+    presenters_dir: Path,
+    hooks_dir: Path,
+    view_models_index: Path,
+) -> int:
+    """Scaffold every missing use case, never overwriting files that already exist."""
+    view_model_exports = index_view_model_exports(view_models_index)
+    generated = 0
+    for use_case in missing:
+        # Keep the discovered PascalCase name as-is; round-tripping through kebab-case
+        # would mangle acronyms in the schema names.
+        feature_pascal = use_case.name
+        feature_kebab = to_kebab_case(feature_pascal)
+        feature_camel = to_camel_case(feature_kebab)
+        use_case_models = use_case.source == SOURCE_USE_CASE_MODELS
+        print(f"\n{feature_pascal} ({feature_kebab}, {use_case.source})")
+
+        # The generated presenter references viewModels.<Feature>ViewModelSchema. Reuse it when
+        # any indexed view model already exports it, and never re-export a name twice.
+        view_model_schema = f"{feature_pascal}ViewModelSchema"
+        view_model_path = view_models_dir / f"{feature_kebab}-view-model.ts"
+        if view_model_schema in view_model_exports:
+            print(f"- Reusing {view_model_schema} from {view_model_exports[view_model_schema]}")
+        else:
+            if view_model_path.exists():
+                exported = find_exported_names(view_model_path)
+                if view_model_schema not in exported:
+                    print(f"⚠ Skipped use case: {view_model_path} does not export "
+                          f"{view_model_schema}, scaffold it manually")
+                    continue
+            else:
+                exported = view_model_template_exports(feature_pascal)
+            clashes = sorted(name for name in exported if name in view_model_exports)
+            if clashes:
+                print(f"⚠ Skipped use case: {', '.join(clashes)} already exported from "
+                      f"{view_model_exports[clashes[0]]}, scaffold it manually")
+                continue
+
+            if view_model_path.exists():
+                print(f"- Skipped existing: {view_model_path}")
+            else:
+                if use_case_models:
+                    success_schema_module = f"../usecase-models/{use_case.models_file.stem}"
+                else:
+                    success_schema_module = CMS_REST_MODULE
+                generate_view_model(feature_kebab, feature_pascal, view_models_dir, success_schema_module)
+                generated += 1
+            update_view_models_index(feature_kebab, view_models_index)
+            view_model_exports.update((name, view_model_path) for name in exported)
+
+        presenter_path = presenters_dir / f"{feature_kebab}-presenter.ts"
+        if presenter_path.exists():
+            print(f"- Skipped existing: {presenter_path}")
+        else:
+            generate_presenter(
+                feature_kebab, feature_pascal, presenters_dir, use_case_models, use_case.error_type
+            )
+            generated += 1
+
+        hook_path = hooks_dir / f"use-{feature_kebab}-presenter.ts"
+        if hook_path.exists():
+            print(f"- Skipped existing: {hook_path}")
+        else:
+            generate_hook(feature_kebab, feature_pascal, feature_camel, hooks_dir)
+            generated += 1
+    return generated
+
+
+def run_discovery(project: str, repo_root: Path, generate: bool) -> None:
+    """Report use cases lacking presenters and optionally scaffold all of them."""
+    view_models_dir = repo_root / "packages/models/src/view-models"
+    presenters_dir = repo_root / f"apps/{project}/src/lib/infrastructure/common/presenters"
+    hooks_dir = repo_root / f"apps/{project}/src/lib/infrastructure/client/hooks"
+    view_models_index = view_models_dir / "index.ts"
 
-    project = sys.argv[1].lower()
-    feature_input = sys.argv[2]
+    coverage = discover_presenter_coverage(project, repo_root)
+    generatable = [use_case for use_case in coverage.missing if use_case.resolved]
+    unresolved = [use_case for use_case in coverage.missing if not use_case.resolved]
 
-    # Validate project
-    if project not in ['platform', 'cms']:
-        print(f"Error: Invalid project '{project}'. Must be 'platform' or 'cms'")
+    print(f"\n{'='*60}")
+    print(f"Presenter Coverage Discovery")
+    print(f"{'='*60}")
+    print(f"Project:      {project}")
+    print(f"Use cases:    {len(coverage.use_cases)} found")
+    print(f"Presenters:   {len(coverage.presenters)} indexed")
+    print(f"Hooks:        {len(coverage.hooks)} indexed")
+    print(f"Missing:      {len(coverage.missing)} use cases without presenter")
+    if not (repo_root / CMS_REST_PACKAGE).exists():
+        print(f"Note:         {CMS_REST_PACKAGE} not installed, cms-rest use cases")
+        print(f"              limited to those imported by apps/{project}")
+    print(f"{'='*60}\n")
+
+    if generatable:
+        print("Use cases without presenter:")
+        for use_case in generatable:
+            print(f"  - {use_case.name:<55} {use_case.source}")
+    elif not unresolved:
+        print("✓ Every use case has a presenter")
+
+    if unresolved:
+        print("\n⚠ Use cases without presenter that cannot be generated")
+        print("  (their usecase-models file is missing names the generated files import):")
+        for use_case in unresolved:
+            print(f"  - {use_case.name:<40} {use_case.models_file.relative_to(repo_root)}: {use_case.problem}")
+
+    if coverage.presenters_without_hooks:
+        print("\nPresenters without 'use-<feature>-presenter' hook:")
+        for path in coverage.presenters_without_hooks:
+            print(f"  - {path.relative_to(repo_root)}")
+
+    if not generate or not generatable:
+        if generatable:
+            print("\nRe-run with --generate to scaffold all missing presenters.")
+        print(f"\n{'='*60}\n")
+        return
+
+    for dir_path, name in [(view_models_dir, "View models"),
+                            (presenters_dir, "Presenters"),
+                            (hooks_dir, "Hooks")]:
+        if not dir_path.exists():
+            print(f"✗ Error: {name} directory not found: {dir_path}")
+            sys.exit(1)
+
+    print("\nGenerating files...")
+    try:
+        generated = generate_missing_scaffolds(
+            generatable, view_models_dir, presenters_dir, hooks_dir, view_models_index
+        )
+    except Exception as e:
+        print(f"\n✗ Error during generation: {e}")
+        import traceback
+        traceback.print_exc()
         sys.exit(1)
 
+    print(f"\n{'='*60}")
+    print(f"✓ Generated {generated} files for {len(generatable)} use cases")
+    print(f"{'='*60}\n")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments; flags may be given in any order."""
+    parser = argparse.ArgumentParser(
+        description="Generate presenter scaffolds (view-model, presenter, hook).",
+        epilog=(
+            "Examples:\n"
+            "  python3 tools/generate-presenter-scaffold.py cms save-home-page\n"
+            "  python3 tools/generate-presenter-scaffold.py cms --discover --generate"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('project', type=str.lower, choices=['platform', 'cms'],
+                        help="'platform' or 'cms'")
+    parser.add_argument('feature', nargs='?',
+                        help="Any casing (e.g., 'SaveHomePage', 'save-home-page')")
+    parser.add_argument('--discover', action='store_true',
+                        help="List use cases that have no presenter yet")
+    parser.add_argument('--generate', action='store_true',
+                        help="With --discover, scaffold all missing presenters")
+    args = parser.parse_args(argv)
+
+    if args.discover and args.feature:
+        parser.error("--discover does not take a feature name")
+    if args.generate and not args.discover:
+        parser.error("--generate requires --discover")
+    if not args.discover and not args.feature:
+        parser.error("missing feature name (or use --discover)")
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    project = args.project
+
+    if args.discover:
+        run_discovery(project, Path(__file__).parent.parent, args.generate)
+        return
+
+    feature_input = args.feature
+
     # Convert to different cases
     feature_kebab = to_kebab_case(feature_input)
     feature_pascal = to_pascal_case(feature_kebab)
@@ -0,0 +1,267 @@
+"""Tests for the discovery mode of generate-presenter-scaffold.py, run against a temporary tree."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "generate-presenter-scaffold.py"
+_spec = importlib.util.spec_from_file_location("generate_presenter_scaffold", SCRIPT_PATH)
+scaffold = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = scaffold
+_spec.loader.exec_module(scaffold)
+
+CMS_REST_PRESENTER = """import {{
+    {schemas}
+}} from '@dream-aim-deliver/e-class-cms-rest';
+
+export default class Presenter extends BasePresenter {{
+    constructor() {{
+        super({{
+            schemas: {{
+                responseModel:
+                    {response_model},
+                viewModel: viewModels.ViewModelSchema
+            }},
+        }});
+    }}
+}}
+"""
+
+USE_CASE_MODELS = """export const {name}SuccessResponseSchema = BaseSuccessSchemaFactory(z.object({{}}));
+export type T{name}UseCaseErrorResponse = z.infer<typeof {name}UseCaseErrorResponseSchema>;
+export const {name}UseCaseResponseSchema = BaseStatusDiscriminatedUnionSchemaFactory([]);
+export type T{name}UseCaseResponse = z.infer<typeof {name}UseCaseResponseSchema>;
+"""
+
+
+def write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+@pytest.fixture
+def repo_root(tmp_path: Path) -> Path:
+    platform = tmp_path / "apps/platform/src/lib/infrastructure"
+    cms = tmp_path / "apps/cms/src/lib/infrastructure"
+
+    # Named differently from its use case, covered through its responseModel
+    write(platform / "common/presenters/categories-presenter.ts", CMS_REST_PRESENTER.format(
+        schemas="ListCategoriesUseCaseResponseSchema,",
+        response_model="ListCategoriesUseCaseResponseSchema",
+    ))
+    # Copy-pasted import of GetHomePage, which it does not present
+    write(platform / "common/presenters/courses-presenter.ts", CMS_REST_PRESENTER.format(
+        schemas="ListCoursesUseCaseResponseSchema,\n    GetHomePageUseCaseResponseSchema,",
+        response_model="ListCoursesUseCaseResponseSchema",
+    ))
+    # Server presenter wrapping a common one, covered through its name only
+    write(platform / "server/presenter/get-course-access-presenter.ts",
+          "import CourseAccessPresenter from '../../common/presenters/course-access-presenter';\n")
+    write(platform / "client/hooks/use-categories-presenter.ts", "")
+    write(platform / "client/hooks/use-check-time-left.ts", "")
+    write(platform / "client/pages/course-access.tsx",
+          "import { GetCourseAccessUseCaseResponseSchema } from '@dream-aim-deliver/e-class-cms-rest';\n"
+          "import { GetAssignmentUseCaseResponseSchema } from '@dream-aim-deliver/e-class-cms-rest';\n"
+          "const verify = trpc.verifyFile.useMutation();\n"
+          "type TBroken = useCaseModels.TBrokenUseCaseResponse;\n"
+          "type TNoResponse = useCaseModels.TNoResponseTypeUseCaseErrorResponse;\n"
+          "type TNotes = useCaseModels.TListStudentNotesRequest;\n")
+
+    write(cms / "common/presenters/save-home-page-presenter.ts", CMS_REST_PRESENTER.format(
+        schemas="SaveHomePageUseCaseResponseSchema,",
+        response_model="SaveHomePageUseCaseResponseSchema",
+    ))
+    write(cms / "client/pages/courses.tsx",
+          "const verify = trpc.verifyFile.useMutation();\n"
+          "const archive = trpc.archiveCourse.useMutation();\n")
+
+    models = tmp_path / "packages/models/src"
+    usecase_models = models / "usecase-models"
+    write(usecase_models / "verify-file-usecase-models.ts", USE_CASE_MODELS.format(name="VerifyFile"))
+    write(usecase_models / "list-student-notes-usecase-models.ts",
+          USE_CASE_MODELS.format(name="ListStudentNotes"))
+    # Complete, but not re-exported from usecase-models/index.ts
+    write(usecase_models / "archive-course-usecase-models.ts", USE_CASE_MODELS.format(name="ArchiveCourse"))
+    # No exported error type
+    write(usecase_models / "broken-usecase-models.ts",
+          "\n".join(line for line in USE_CASE_MODELS.format(name="Broken").splitlines()
+                    if "ErrorResponse" not in line) + "\n")
+    # No exported T<Name>UseCaseResponse
+    write(usecase_models / "no-response-type-usecase-models.ts",
+          "\n".join(line for line in USE_CASE_MODELS.format(name="NoResponseType").splitlines()
+                    if "export type TNoResponseTypeUseCaseResponse" not in line) + "\n")
+    write(usecase_models / "index.ts", "".join(
+        f"export * from './{stem}-usecase-models';\n"
+        for stem in ["verify-file", "list-student-notes", "broken", "no-response-type"]
+    ))
+
+    view_models = models / "view-models"
+    # Exports the GetAssignment view model names under a different file name
+    write(view_models / "assignment-view-model.ts",
+          "export const GetAssignmentSuccessSchema = GetAssignmentSuccessResponseSchema.shape.data;\n"
+          "export const GetAssignmentViewModelSchema = BaseViewModelDiscriminatedUnionSchemaFactory(map);\n"
+          "export type TGetAssignmentViewModel = z.infer<typeof GetAssignmentViewModelSchema>;\n")
+    write(view_models / "index.ts", "export * from './assignment-view-model';\n")
+    (cms / "client/hooks").mkdir(parents=True, exist_ok=True)
+    return tmp_path
+
+
+def missing_names(coverage) -> list:
+    return [use_case.name for use_case in coverage.missing]
+
+
+def test_use_cases_are_scoped_to_the_project(repo_root: Path):
+    platform_use_cases = scaffold.collect_use_cases("platform", repo_root)
+    cms_use_cases = scaffold.collect_use_cases("cms", repo_root)
+
+    assert "SaveHomePage" not in platform_use_cases
+    assert "SaveHomePage" in cms_use_cases
+    assert "ListCategories" not in cms_use_cases
+    # usecase-models are shared, but only count for the app referring to them
+    assert "VerifyFile" in platform_use_cases and "VerifyFile" in cms_use_cases
+    assert "ListStudentNotes" in platform_use_cases
+    assert "ListStudentNotes" not in cms_use_cases
+
+
+def test_use_case_sources(repo_root: Path):
+    use_cases = scaffold.collect_use_cases("platform", repo_root)
+
+    assert use_cases["GetHomePage"].source == scaffold.SOURCE_CMS_REST
+    assert use_cases["GetHomePage"].resolved
+    assert use_cases["VerifyFile"].source == scaffold.SOURCE_USE_CASE_MODELS
+    assert use_cases["VerifyFile"].error_type == "TVerifyFileUseCaseErrorResponse"
+    assert use_cases["VerifyFile"].resolved
+    assert use_cases["Broken"].problem == "does not export TBrokenUseCaseErrorResponse"
+
+
+def test_use_case_models_must_export_everything_the_presenter_imports(repo_root: Path):
+    platform_use_cases = scaffold.collect_use_cases("platform", repo_root)
+    cms_use_cases = scaffold.collect_use_cases("cms", repo_root)
+
+    assert platform_use_cases["NoResponseType"].problem == (
+        "does not export TNoResponseTypeUseCaseResponse"
+    )
+    assert cms_use_cases["ArchiveCourse"].problem == "not re-exported from usecase-models/index.ts"
+
+    scaffold.run_discovery("cms", repo_root, generate=True)
+
+    presenters_dir = repo_root / "apps/cms/src/lib/infrastructure/common/presenters"
+    assert not (presenters_dir / "archive-course-presenter.ts").exists()
+    assert (presenters_dir / "verify-file-presenter.ts").exists()
+
+
+def test_coverage_by_name_and_response_model(repo_root: Path):
+    coverage = scaffold.discover_presenter_coverage("platform", repo_root)
+
+    # ListCategories by responseModel, GetCourseAccess by name; GetHomePage is only
+    # referenced outside a responseModel and therefore still missing.
+    assert missing_names(coverage) == [
+        "Broken", "GetAssignment", "GetHomePage", "ListStudentNotes", "NoResponseType", "VerifyFile",
+    ]
+
+
+def test_hook_index(repo_root: Path):
+    infrastructure_dir = repo_root / "apps/platform/src/lib/infrastructure"
+    presenters, hooks = scaffold.index_presenters(infrastructure_dir)
+
+    assert hooks == {"categories"}
+    assert presenters[infrastructure_dir / "common/presenters/courses-presenter.ts"] == "ListCourses"
+    assert presenters[infrastructure_dir / "server/presenter/get-course-access-presenter.ts"] is None
+
+    coverage = scaffold.discover_presenter_coverage("platform", repo_root)
+    assert coverage.presenters_without_hooks == [
+        infrastructure_dir / "common/presenters/courses-presenter.ts",
+    ]
+
+
+def test_generate_leaves_existing_files_untouched(repo_root: Path):
+    view_models_dir = repo_root / "packages/models/src/view-models"
+    presenters_dir = repo_root / "apps/platform/src/lib/infrastructure/common/presenters"
+    hooks_dir = repo_root / "apps/platform/src/lib/infrastructure/client/hooks"
+    existing_view_model = "export const GetHomePageViewModelSchema = customised;\n"
+    write(view_models_dir / "get-home-page-view-model.ts", existing_view_model)
+
+    scaffold.run_discovery("platform", repo_root, generate=True)
+
+    assert (view_models_dir / "get-home-page-view-model.ts").read_text() == existing_view_model
+    assert (presenters_dir / "get-home-page-presenter.ts").exists()
+    assert (hooks_dir / "use-get-home-page-presenter.ts").exists()
+    assert not (presenters_dir / "broken-presenter.ts").exists()
+
+    presenter = (presenters_dir / "verify-file-presenter.ts").read_text()
+    assert "useCaseModels.VerifyFileUseCaseResponseSchema" in presenter
+    assert "useCaseModels.TVerifyFileUseCaseErrorResponse" in presenter
+    assert "e-class-cms-rest" not in presenter
+    assert "'../usecase-models/verify-file-usecase-models'" in (
+        view_models_dir / "verify-file-view-model.ts").read_text()
+
+    # A second run finds nothing left to generate and keeps edited files
+    write(presenters_dir / "verify-file-presenter.ts", "edited\n")
+    index_before = (view_models_dir / "index.ts").read_text()
+    scaffold.run_discovery("platform", repo_root, generate=True)
+    assert (presenters_dir / "verify-file-presenter.ts").read_text() == "edited\n"
+    assert (view_models_dir / "index.ts").read_text() == index_before
+    assert missing_names(scaffold.discover_presenter_coverage("platform", repo_root)) == [
+        "Broken", "NoResponseType",
+    ]
+
+
+def test_generate_skips_existing_view_model_with_other_exports(repo_root: Path):
+    presenters_dir = repo_root / "apps/platform/src/lib/infrastructure/common/presenters"
+    write(repo_root / "packages/models/src/view-models/get-home-page-view-model.ts",
+          "export const HomePageViewModelSchema = customised;\n")
+
+    scaffold.run_discovery("platform", repo_root, generate=True)
+
+    assert not (presenters_dir / "get-home-page-presenter.ts").exists()
+
+
+def test_generate_reuses_view_model_exported_from_another_file(repo_root: Path):
+    view_models_dir = repo_root / "packages/models/src/view-models"
+    presenters_dir = repo_root / "apps/platform/src/lib/infrastructure/common/presenters"
+    hooks_dir = repo_root / "apps/platform/src/lib/infrastructure/client/hooks"
+
+    scaffold.run_discovery("platform", repo_root, generate=True)
+
+    assert not (view_models_dir / "get-assignment-view-model.ts").exists()
+    assert "get-assignment-view-model" not in (view_models_dir / "index.ts").read_text()
+    presenter = (presenters_dir / "get-assignment-presenter.ts").read_text()
+    assert "viewModels.GetAssignmentViewModelSchema" in presenter
+    assert (hooks_dir / "use-get-assignment-presenter.ts").exists()
+
+
+def test_generate_skips_view_model_names_exported_elsewhere(repo_root: Path):
+    view_models_dir = repo_root / "packages/models/src/view-models"
+    presenters_dir = repo_root / "apps/platform/src/lib/infrastructure/common/presenters"
+    # Exports part of the GetHomePage names, but not its view model schema
+    write(view_models_dir / "home-page-view-model.ts",
+          "export const GetHomePageSuccessSchema = GetHomePageSuccessResponseSchema.shape.data;\n")
+    write(view_models_dir / "index.ts",
+          "export * from './assignment-view-model';\nexport * from './home-page-view-model';\n")
+
+    scaffold.run_discovery("platform", repo_root, generate=True)
+
+    assert not (view_models_dir / "get-home-page-view-model.ts").exists()
+    assert not (presenters_dir / "get-home-page-presenter.ts").exists()
+    assert "get-home-page-view-model" not in (view_models_dir / "index.ts").read_text()
+
+
+@pytest.mark.parametrize("argv", [
+    ["platform", "--generate"],
+    ["platform", "--generate-view-model"],
+    ["platform", "save-home-page", "--discover"],
+    ["platform"],
+    ["web", "save-home-page"],
+])
+def test_invalid_arguments_are_rejected(argv):
+    with pytest.raises(SystemExit):
+        scaffold.parse_args(argv)
+
+
+def test_flags_are_parsed_in_any_order():
+    args = scaffold.parse_args(["CMS", "--generate", "--discover"])
+
+    assert (args.project, args.feature, args.discover, args.generate) == ("cms", None, True, True)
+    assert scaffold.parse_args(["cms", "SaveHomePage"]).feature == "SaveHomePage"